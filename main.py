@@ -1,8 +1,12 @@
 import csv
+from bisect import bisect_right
 from datetime import datetime, timedelta, date
 from collections import defaultdict
-import calendar
+from functools import lru_cache
 import os
+import pickle
+import re
+import sys
 import json
 import shutil
 import copy
@@ -15,14 +19,39 @@ def _today() -> date:
     return datetime.now().date()
 
 
+# Month steps for the frequencies that advance by whole months.
+_MONTH_STEPS = {'monthly': 1, 'bi-monthly': 2, 'quarterly': 3, 'yearly': 12}
+
+# Shared validator tables for the interactive prompts, built once at import.
+_BASE_FREQUENCIES = ("weekly", "bi-weekly", "monthly", "bi-monthly", "quarterly", "yearly", "one-time")
+_BASE_FREQUENCY_SET = frozenset(_BASE_FREQUENCIES)
+_BASE_FREQUENCY_PROMPT = "(" + ", ".join(_BASE_FREQUENCIES)
+_YES_ANSWERS = frozenset({"yes", "y"})
+_NO_ANSWERS = frozenset({"no", "n"})
+
+# Invariant prompts reused across the management loops.
+_SET_PERIODIC_PROMPT = "Do you want to set a periodic schedule? (e.g., weekly, monthly)"
+_MANUAL_DATES_HINT = "You've chosen to enter specific dates manually."
+
+_MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@lru_cache(maxsize=512)
+def _days_in_month(year, month):
+    """Cached day count for a month; (year, month) pairs repeat heavily across schedules."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_LENGTHS[month - 1]
+
+
 def get_date_input(prompt, start_after=None):
     """Helper function to get a valid date input, with optional validation."""
     while True:
         date_str = input(prompt + " (YYYY-MM-DD): ")
         try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+            date_obj = date.fromisoformat(date_str)
             if start_after and date_obj <= start_after:
-                print(f"Error: The date must be after {start_after.strftime('%Y-%m-%d')}.")
+                print(f"Error: The date must be after {start_after.isoformat()}.")
                 continue
             return date_obj
         except ValueError:
@@ -47,11 +76,11 @@ def get_float_input(prompt):
 
 def get_frequency_input(prompt, extra_options=None):
     """Helper function to get a valid frequency input, with optional extra choices."""
-    valid_options = ["weekly", "bi-weekly", "monthly", "bi-monthly", "quarterly", "yearly", "one-time"]
-    prompt_options = "(weekly, bi-weekly, monthly, bi-monthly, quarterly, yearly, one-time"
+    valid_options = _BASE_FREQUENCY_SET
+    prompt_options = _BASE_FREQUENCY_PROMPT
 
     if extra_options:
-        valid_options.extend(extra_options)
+        valid_options = valid_options.union(extra_options)
         prompt_options += ", " + ", ".join(extra_options)
     prompt_options += "): "
 
@@ -66,16 +95,20 @@ def get_frequency_input(prompt, extra_options=None):
 
 
 def get_multiple_dates(prompt):
-    """Helper function to get multiple dates."""
+    """Helper function to get multiple dates. Several dates may be entered
+    on one line, separated by commas or spaces."""
     dates = []
     while True:
-        date_str = input(prompt + " (YYYY-MM-DD) or 'done' to finish: ").lower()
-        if date_str == 'done':
+        line = input(prompt + " (YYYY-MM-DD) or 'done' to finish: ").lower()
+        if line == 'done':
             break
-        try:
-            dates.append(datetime.strptime(date_str, "%Y-%m-%d").date())
-        except ValueError:
-            print("Invalid date format. Please use YYYY-MM-DD.")
+        for token in re.split(r'[,\s]+', line.strip()):
+            if not token:
+                continue
+            try:
+                dates.append(date.fromisoformat(token))
+            except ValueError:
+                print(f"Invalid date format '{token}'. Please use YYYY-MM-DD.")
     return dates
 
 
@@ -83,9 +116,9 @@ def get_yes_no_input(prompt):
     """Helper function to get a yes/no answer."""
     while True:
         response = input(prompt + " (yes/no): ").lower()
-        if response in ["yes", "y"]:
+        if response in _YES_ANSWERS:
             return True
-        elif response in ["no", "n"]:
+        elif response in _NO_ANSWERS:
             return False
         else:
             print("Invalid input. Please enter 'yes' or 'no'.")
@@ -96,90 +129,144 @@ def get_savings_target_input(prompt, existing_targets):
     if not existing_targets:
         print("You must first create a savings account before adding a transfer schedule.")
         return None
+    target_names = {target.name for target in existing_targets}
+    lines = ["Available savings targets:"]
+    lines.extend(f"  {i + 1}. {target.name}" for i, target in enumerate(existing_targets))
+    print('\n'.join(lines))
     while True:
-        print("Available savings targets:")
-        for i, target in enumerate(existing_targets):
-            print(f"  {i + 1}. {target.name}")
         choice = input(prompt + " (Enter the number or name): ")
-        try:
+        if choice.isdigit():
             choice_idx = int(choice) - 1
             if 0 <= choice_idx < len(existing_targets):
                 return existing_targets[choice_idx].name
-            else:
-                print("Invalid number.")
-        except ValueError:
-            if any(t.name == choice for t in existing_targets):
-                return choice
-            else:
-                print(f"'{choice}' is not a valid savings target.")
+            print("Invalid number.")
+        elif choice in target_names:
+            return choice
+        else:
+            print(f"'{choice}' is not a valid savings target.")
+
+
+# Parsed holiday files keyed by (path, mtime_ns) so bouncing between user
+# sessions does not re-read and re-parse the same unchanged files.
+_HOLIDAY_FILE_CACHE = {}
 
 
 def load_holidays(filepaths):
-    """Loads holidays from a list of TXT files into a set of date objects."""
+    """
+    Loads holidays from a list of TXT files into a frozenset of date ordinals.
+    Storing ordinals (plain ints) makes the business-day membership test in the
+    schedule generators cheaper than hashing date objects. Each file's parse
+    is cached against its mtime, so repeated sessions only pay for changes.
+    """
     holidays_set = set()
     for filepath in filepaths:
-        if not os.path.exists(filepath):
+        try:
+            cache_key = (filepath, os.stat(filepath).st_mtime_ns)
+        except OSError:
             print(f"Warning: Holiday file not found at '{filepath}'. Skipping.")
             continue
+        cached = _HOLIDAY_FILE_CACHE.get(cache_key)
+        if cached is not None:
+            holidays_set.update(cached)
+            continue
         try:
-            with open(filepath, 'r') as f:
-                for line in f:
-                    parts = line.strip().split(',')
-                    if len(parts) == 2:
-                        try:
-                            holiday_date = datetime.strptime(parts[1].strip(), "%Y-%m-%d").date()
-                            holidays_set.add(holiday_date)
-                        except ValueError:
-                            print(f"Warning: Could not parse holiday date '{parts[1].strip()}' in line: {line.strip()}")
-                    else:
-                        print(f"Warning: Skipping malformed holiday line: {line.strip()}")
+            # Slurp the whole file; splitlines runs in one C call, which beats
+            # iterating the file object line by line for these small files.
+            with open(filepath, 'r', newline='') as f:
+                raw = f.read()
+            malformed = []
+            file_holidays = set()
+            for row in csv.reader(raw.splitlines()):
+                if len(row) == 2:
+                    try:
+                        file_holidays.add(date.fromisoformat(row[1].strip()).toordinal())
+                    except ValueError:
+                        malformed.append(','.join(row))
+                elif row:
+                    malformed.append(','.join(row))
+            for line in malformed:
+                print(f"Warning: Skipping malformed holiday line: {line}")
+            _HOLIDAY_FILE_CACHE[cache_key] = frozenset(file_holidays)
+            holidays_set.update(file_holidays)
         except Exception as e:
             print(f"Error reading holiday file '{filepath}': {e}")
-    return holidays_set
+    return frozenset(holidays_set)
 
 
 def is_business_day(date, holidays_set):
     """Checks if a given date is a business day (Mon-Fri and not a holiday)."""
-    if date.weekday() >= 5:
+    ordinal = date.toordinal()
+    # Ordinal 1 (0001-01-01) is a Monday, so Saturday/Sunday are 6 and 0 mod 7.
+    if ordinal % 7 in (6, 0):
         return False
-    if date in holidays_set:
+    if ordinal in holidays_set:
         return False
     return True
 
 
+def previous_business_day(target_date, holidays_set):
+    """
+    Walks a date back to the closest business day on or before it.
+    Works on the date's ordinal so the loop decrements an int instead of
+    constructing a new date object per step. Weekends are skipped with a
+    single arithmetic jump, so only runs of consecutive holidays ever loop.
+    """
+    return date.fromordinal(previous_business_ordinal(target_date.toordinal(), holidays_set))
+
+
+def previous_business_ordinal(ordinal, holidays_set):
+    """Ordinal-level core of previous_business_day, for callers already in ordinal space."""
+    while True:
+        day_of_week = ordinal % 7
+        if day_of_week == 6:  # Saturday -> Friday
+            ordinal -= 1
+        elif day_of_week == 0:  # Sunday -> Friday
+            ordinal -= 2
+        elif ordinal in holidays_set:
+            ordinal -= 1
+        else:
+            return ordinal
+
+
 def calculate_twice_monthly_dates(start_date, end_date, holidays_set):
     """
     Generates 15th and last-day-of-month dates between start_date and end_date,
     adjusting to the closest business day *before* if it falls on a weekend or holiday.
     """
     dates = []
-    current_iter_date = start_date
 
-    while current_iter_date <= end_date:
-        year = current_iter_date.year
-        month = current_iter_date.month
+    # Enumerate (year, month) pairs directly via a flat month index instead of
+    # walking a date forward a month at a time; no year-rollover branching.
+    first_month = start_date.year * 12 + start_date.month - 1
+    last_month = end_date.year * 12 + end_date.month - 1
+
+    for month_index in range(first_month, last_month + 1):
+        year, month = divmod(month_index, 12)
+        month += 1
 
-        target_15th = datetime(year, month, 15).date()
+        target_15th = date(year, month, 15)
         if start_date <= target_15th <= end_date:
-            adjusted_date = target_15th
-            while not is_business_day(adjusted_date, holidays_set):
-                adjusted_date -= timedelta(days=1)
-            dates.append(adjusted_date)
+            dates.append(previous_business_day(target_15th, holidays_set))
 
-        last_day_of_month_num = calendar.monthrange(year, month)[1]
-        target_last_day = datetime(year, month, last_day_of_month_num).date()
+        target_last_day = date(year, month, _days_in_month(year, month))
         if start_date <= target_last_day <= end_date:
-            adjusted_date = target_last_day
-            while not is_business_day(adjusted_date, holidays_set):
-                adjusted_date -= timedelta(days=1)
-            dates.append(adjusted_date)
+            dates.append(previous_business_day(target_last_day, holidays_set))
 
-        if month == 12:
-            current_iter_date = datetime(year + 1, 1, 1).date()
-        else:
-            current_iter_date = datetime(year, month + 1, 1).date()
+    # Candidates are at least 13 days apart and the back-off moves a date at
+    # most a few days, so the list is already unique and ascending as built;
+    # no dedupe or sort pass is needed.
+    return dates
 
-    return sorted(list(set(dates)))
+
+def _add_months(anchor_day, current_date, months):
+    """
+    Steps current_date forward by a number of months using divmod rollover,
+    clamping the day to anchor_day or the end of the target month.
+    """
+    year, month = divmod(current_date.month - 1 + months, 12)
+    year += current_date.year
+    month += 1
+    return date(year, month, min(anchor_day, _days_in_month(year, month)))
 
 
 def calculate_bi_monthly_dates_every_two_months(start_date, end_date, holidays_set, adjust_for_holidays=True):
@@ -194,17 +281,10 @@ def calculate_bi_monthly_dates_every_two_months(start_date, end_date, holidays_s
         adjusted_date = current_date
         # --- MODIFIED LOGIC ---
         if adjust_for_holidays:
-            while not is_business_day(adjusted_date, holidays_set):
-                adjusted_date -= timedelta(days=1)
+            adjusted_date = previous_business_day(adjusted_date, holidays_set)
         dates.append(adjusted_date)
 
-        new_month = current_date.month + 2
-        new_year = current_date.year
-        if new_month > 12:
-            new_month -= 12
-            new_year += 1
-        day = min(current_date.day, calendar.monthrange(new_year, new_month)[1])
-        current_date = datetime(new_year, new_month, day).date()
+        current_date = _add_months(current_date.day, current_date, 2)
 
     return sorted(list(set(dates)))
 
@@ -213,56 +293,89 @@ def get_recurring_dates(start_date, end_date, frequency, holidays_set=None, adju
     """
     Generates a list of recurring dates based on frequency.
     Date adjustment for weekends/holidays is now conditional.
+    Results are memoized, since bills commonly share (start, end, frequency).
     """
+    if holidays_set is None:
+        holidays_set = frozenset()
+    elif not isinstance(holidays_set, frozenset):
+        holidays_set = frozenset(holidays_set)
+    return list(_recurring_dates_cached(start_date, end_date, frequency, holidays_set, adjust_for_holidays))
+
+
+@lru_cache(maxsize=128)
+def _recurring_dates_cached(start_date, end_date, frequency, holidays_set, adjust_for_holidays):
+    """Cached core of get_recurring_dates; returns an immutable tuple of dates."""
     dates = []
     current_date = start_date
-    holidays_set = holidays_set if holidays_set is not None else set()
+
+    # Weekly frequencies step by a fixed number of days, so the whole schedule
+    # can be produced by striding ordinals instead of looping date arithmetic.
+    if frequency in ('weekly', 'bi-weekly'):
+        step = 7 if frequency == 'weekly' else 14
+        ordinals = range(start_date.toordinal(), end_date.toordinal() + 1, step)
+        # Bind the constructor once; LOAD_FAST in the comprehension instead of
+        # a global + attribute lookup per emitted date.
+        from_ordinal = date.fromordinal
+        if adjust_for_holidays:
+            dates = [from_ordinal(previous_business_ordinal(o, holidays_set)) for o in ordinals]
+        else:
+            dates = [from_ordinal(o) for o in ordinals]
+        # Already generated in order; dedupe without re-sorting.
+        return tuple(dict.fromkeys(dates))
 
     while current_date <= end_date:
         adjusted_date = current_date
         # --- MODIFIED LOGIC ---
         # Only adjust the date if the flag is True
         if adjust_for_holidays:
-            while not is_business_day(adjusted_date, holidays_set):
-                adjusted_date -= timedelta(days=1)
+            adjusted_date = previous_business_day(adjusted_date, holidays_set)
 
         dates.append(adjusted_date)
 
-        # Calculation for the next date remains the same
-        if frequency == 'weekly':
-            current_date += timedelta(weeks=1)
-        elif frequency == 'bi-weekly':
-            current_date += timedelta(weeks=2)
-        elif frequency == 'monthly':
-            new_month = current_date.month + 1
-            new_year = current_date.year
-            if new_month > 12:
-                new_month = 1
-                new_year += 1
-            day = min(start_date.day, calendar.monthrange(new_year, new_month)[1])
-            current_date = datetime(new_year, new_month, day).date()
-        elif frequency == 'bi-monthly':
-            new_month = current_date.month + 2
-            new_year = current_date.year
-            if new_month > 12:
-                new_month -= 12
-                new_year += 1
-            day = min(start_date.day, calendar.monthrange(new_year, new_month)[1])
-            current_date = datetime(new_year, new_month, day).date()
-        elif frequency == 'quarterly':
-            new_month = current_date.month + 3
-            new_year = current_date.year
-            if new_month > 12:
-                new_month -= 12
-                new_year += 1
-            day = min(start_date.day, calendar.monthrange(new_year, new_month)[1])
-            current_date = datetime(new_year, new_month, day).date()
-        elif frequency == 'yearly':
-            current_date = datetime(current_date.year + 1, start_date.month, start_date.day).date()
-        else:
+        # Calculation for the next date remains the same; every remaining
+        # frequency is a fixed month step anchored to the schedule's start day.
+        step_months = _MONTH_STEPS.get(frequency)
+        if step_months is None:
             break
+        current_date = _add_months(start_date.day, current_date, step_months)
 
-    return sorted(list(set(dates)))
+    # The walk is monotonic and the business-day back-off preserves order, so
+    # the list is already sorted; dedupe in place of sorted(list(set(...))).
+    return tuple(dict.fromkeys(dates))
+
+
+def bin_weekly_amounts(items, weeks, key_func):
+    """
+    Bins item amounts into per-week buckets in one pass over the occurrences.
+    weeks must be ascending Monday dates one week apart. An item contributes
+    its amount at most once per week that contains one of its dates, and not
+    in weeks starting after its expiry date. Returns (totals, breakdowns)
+    where totals[i] is the week's sum and breakdowns[i] maps key_func(item)
+    to its amount for week i, so the report loop only has to read its bucket.
+    """
+    n = len(weeks)
+    # Ordinal (int) comparisons in the inner loop instead of date objects:
+    # subtracting dates allocates a timedelta per probe, int maths does not.
+    period_start_ord = weeks[0].toordinal()
+    totals = [0.0] * n
+    breakdowns = [{} for _ in range(n)]
+    for item in items:
+        key = key_func(item)
+        amount = item.amount
+        expiry = getattr(item, 'expiry_date', None)
+        expiry_ord = expiry.toordinal() if expiry else None
+        last_index = -1
+        for item_date in sorted(item.dates):
+            week_index = (item_date.toordinal() - period_start_ord) // 7
+            if week_index < 0 or week_index >= n or week_index == last_index:
+                continue
+            if expiry_ord is not None and period_start_ord + week_index * 7 > expiry_ord:
+                break
+            last_index = week_index
+            breakdown = breakdowns[week_index]
+            breakdown[key] = breakdown.get(key, 0.0) + amount
+            totals[week_index] += amount
+    return totals, breakdowns
 
 
 # --- NEW: OOP Class Definitions ---
@@ -270,8 +383,14 @@ def get_recurring_dates(start_date, end_date, frequency, holidays_set=None, adju
 class FinancialItem:
     """Base class for any item with a name, amount, and schedule."""
 
+    # Slots keep the many small item records compact and make attribute
+    # access a fixed offset instead of a per-instance dict lookup.
+    __slots__ = ('name', 'amount', 'frequency', 'dates', 'start_date_for_schedule')
+
     def __init__(self, name, amount, frequency, dates=None, start_date_for_schedule=None):
-        self.name = name
+        # Intern the name so the many equality checks in the category filters
+        # and editors compare by pointer instead of character by character.
+        self.name = sys.intern(name)
         self.amount = amount
         self.frequency = frequency
         self.dates = dates if dates is not None else []
@@ -282,69 +401,67 @@ class FinancialItem:
             'name': self.name,
             'amount': self.amount,
             'frequency': self.frequency,
-            'dates': [d.isoformat() for d in self.dates],
+            'dates': list(self.dates),
         }
         if self.start_date_for_schedule:
-            data['start_date_for_schedule'] = self.start_date_for_schedule.isoformat()
+            data['start_date_for_schedule'] = self.start_date_for_schedule
         return data
 
     @classmethod
     def from_dict(cls, data):
-        # Create a mutable copy to avoid altering the original dictionary
-        init_data = data.copy()
-
-        # Deserialize dates
-        init_data['dates'] = [datetime.fromisoformat(d).date() for d in init_data.get('dates', [])]
-        if init_data.get('start_date_for_schedule'):
-            init_data['start_date_for_schedule'] = datetime.fromisoformat(init_data['start_date_for_schedule']).date()
-
-        # Remove keys that are not part of the constructor for this specific class
-        # This makes the from_dict more robust for subclasses
-        if 'category' in init_data:
-            del init_data['category']
-        if 'expiry_date' in init_data:
-            del init_data['expiry_date']
-        if 'target' in init_data:
-            del init_data['target']
-
-        return cls(**init_data)
+        # Pull exactly the constructor's fields by name; copying the dict
+        # just to delete the keys other classes use is wasted work.
+        # Sort the dates on load: older budget files stored manual-schedule
+        # dates in entry order, and the bisect-based expiry trims require a
+        # sorted list.
+        start = data.get('start_date_for_schedule')
+        return cls(
+            name=data['name'],
+            amount=data['amount'],
+            frequency=data['frequency'],
+            dates=sorted(date.fromisoformat(d) for d in data.get('dates', [])),
+            start_date_for_schedule=date.fromisoformat(start) if start else None)
 
 
 class Expense(FinancialItem):
     """Represents an expense, inheriting from FinancialItem."""
 
+    __slots__ = ('category', 'expiry_date')
+
     def __init__(self, name, amount, frequency, category, dates=None, start_date_for_schedule=None, expiry_date=None):
         super().__init__(name, amount, frequency, dates, start_date_for_schedule)
-        self.category = category
+        self.category = sys.intern(category)
         self.expiry_date = expiry_date
 
     def to_dict(self):
         data = super().to_dict()
         data.update({
             'category': self.category,
-            'expiry_date': self.expiry_date.isoformat() if self.expiry_date else None
+            'expiry_date': self.expiry_date
         })
         return data
 
     @classmethod
     def from_dict(cls, data):
-        init_data = data.copy()
-        init_data['dates'] = [datetime.fromisoformat(d).date() for d in init_data.get('dates', [])]
-        if init_data.get('start_date_for_schedule'):
-            init_data['start_date_for_schedule'] = datetime.fromisoformat(init_data['start_date_for_schedule']).date()
-        if init_data.get('expiry_date'):
-            init_data['expiry_date'] = datetime.fromisoformat(init_data['expiry_date']).date()
-
-        # For direct instantiation of Expense, remove subclass-specific keys
-        if 'target' in init_data:
-            del init_data['target']
-
-        return cls(**init_data)
+        start = data.get('start_date_for_schedule')
+        expiry = data.get('expiry_date')
+        # The subclasses (Bill, StreamingService, ProRatedIncome) overwrite
+        # the category in their constructors, so passing it through is safe.
+        return cls(
+            name=data['name'],
+            amount=data['amount'],
+            frequency=data['frequency'],
+            category=data.get('category'),
+            dates=sorted(date.fromisoformat(d) for d in data.get('dates', [])),
+            start_date_for_schedule=date.fromisoformat(start) if start else None,
+            expiry_date=date.fromisoformat(expiry) if expiry else None)
 
 
 class Bill(Expense):
     """Represents a bill, a specific type of Expense."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         kwargs['category'] = 'Bills'
         super().__init__(**kwargs)
@@ -353,6 +470,8 @@ class Bill(Expense):
 class StreamingService(Expense):
     """Represents a streaming service, a specific type of Expense."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         kwargs['category'] = 'Streaming Services'
         super().__init__(**kwargs)
@@ -361,6 +480,8 @@ class StreamingService(Expense):
 class ProRatedIncome(Expense):
     """Represents a prorated income payment, a specific type of Expense."""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         kwargs['category'] = 'Income'
         super().__init__(**kwargs)
@@ -369,6 +490,8 @@ class ProRatedIncome(Expense):
 class Income(FinancialItem):
     """Represents an income source, now with an optional expiry date."""
 
+    __slots__ = ('expiry_date',)
+
     def __init__(self, name="Primary Income", amount=0.0, frequency=None, dates=None, start_date_for_schedule=None,
                  expiry_date=None):
         super().__init__(name, amount, frequency, dates, start_date_for_schedule)
@@ -376,31 +499,30 @@ class Income(FinancialItem):
 
     def to_dict(self):
         data = super().to_dict()
-        data['expiry_date'] = self.expiry_date.isoformat() if self.expiry_date else None
+        data['expiry_date'] = self.expiry_date
         return data
 
     @classmethod
     def from_dict(cls, data):
-        init_data = data.copy()
-        init_data['dates'] = [datetime.fromisoformat(d).date() for d in init_data.get('dates', [])]
-        if init_data.get('start_date_for_schedule'):
-            init_data['start_date_for_schedule'] = datetime.fromisoformat(init_data['start_date_for_schedule']).date()
-        if init_data.get('expiry_date'):
-            init_data['expiry_date'] = datetime.fromisoformat(init_data['expiry_date']).date()
-
-        # Clean up keys not in the constructor
-        if 'category' in init_data: del init_data['category']
-        if 'target' in init_data: del init_data['target']
-
-        return cls(**init_data)
+        start = data.get('start_date_for_schedule')
+        expiry = data.get('expiry_date')
+        return cls(
+            name=data.get('name', "Primary Income"),
+            amount=data.get('amount', 0.0),
+            frequency=data.get('frequency'),
+            dates=sorted(date.fromisoformat(d) for d in data.get('dates', [])),
+            start_date_for_schedule=date.fromisoformat(start) if start else None,
+            expiry_date=date.fromisoformat(expiry) if expiry else None)
 
 
 class SavingsTransfer(FinancialItem):
     """Represents a transfer to a savings account."""
 
+    __slots__ = ('target',)
+
     def __init__(self, name, amount, frequency, target, dates=None, start_date_for_schedule=None):
         super().__init__(name, amount, frequency, dates, start_date_for_schedule)
-        self.target = target
+        self.target = sys.intern(target)
 
     def to_dict(self):
         data = super().to_dict()
@@ -409,22 +531,21 @@ class SavingsTransfer(FinancialItem):
 
     @classmethod
     def from_dict(cls, data):
-        init_data = data.copy()
-        init_data['dates'] = [datetime.fromisoformat(d).date() for d in init_data.get('dates', [])]
-        if init_data.get('start_date_for_schedule'):
-            init_data['start_date_for_schedule'] = datetime.fromisoformat(init_data['start_date_for_schedule']).date()
-
-        if 'category' in init_data:
-            del init_data['category']
-        if 'expiry_date' in init_data:
-            del init_data['expiry_date']
-
-        return cls(**init_data)
+        start = data.get('start_date_for_schedule')
+        return cls(
+            name=data['name'],
+            amount=data['amount'],
+            frequency=data['frequency'],
+            target=data['target'],
+            dates=sorted(date.fromisoformat(d) for d in data.get('dates', [])),
+            start_date_for_schedule=date.fromisoformat(start) if start else None)
 
 
 class SavingsAccount:
     """Represents a savings account with a name and balance."""
 
+    __slots__ = ('name', 'balance')
+
     def __init__(self, name, balance=0.0):
         self.name = name
         self.balance = balance
@@ -452,8 +573,8 @@ class Budget:
 
     def to_dict(self):
         return {
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
             'initial_debit_balance': self.initial_debit_balance,
             'savings_balances': {sa.name: sa.balance for sa in self.savings_accounts},
             'income': self.income.to_dict() if self.income else {},
@@ -470,8 +591,8 @@ class Budget:
 
     @classmethod
     def from_dict(cls, data):
-        start = datetime.fromisoformat(data['start_date']).date() if data.get('start_date') else None
-        end = datetime.fromisoformat(data['end_date']).date() if data.get('end_date') else None
+        start = date.fromisoformat(data['start_date']) if data.get('start_date') else None
+        end = date.fromisoformat(data['end_date']) if data.get('end_date') else None
         budget = cls(start, end, data.get('initial_debit_balance', 0.0))
 
         for name, balance in data.get('savings_balances', {}).items():
@@ -502,6 +623,37 @@ class Budget:
 
         return budget
 
+    def _recalculate_item_dates(self, item, should_adjust, expiry, end_date, holidays):
+        """Regenerates one expense's or transfer's dates for the period."""
+        freq = item.frequency
+        needs_expiry_trim = expiry is not None
+
+        if freq == 'match payday' and self.income:
+            item.dates = self.income.dates
+        elif item.start_date_for_schedule:
+            original_start = item.start_date_for_schedule
+            # For unadjusted schedules the generator can stop at the expiry
+            # date directly instead of producing dates past it that the trim
+            # below would immediately discard.
+            schedule_end = end_date
+            if expiry is not None and not should_adjust and expiry < end_date:
+                schedule_end = expiry
+            if freq == 'bi-monthly':
+                item.dates = calculate_bi_monthly_dates_every_two_months(original_start, schedule_end, holidays,
+                                                                         adjust_for_holidays=should_adjust)
+                needs_expiry_trim = should_adjust and expiry is not None
+            elif freq not in ['one-time', 'manual']:
+                item.dates = get_recurring_dates(original_start, schedule_end, freq, holidays,
+                                                 adjust_for_holidays=should_adjust)
+                needs_expiry_trim = should_adjust and expiry is not None
+
+        if needs_expiry_trim:
+            cutoff = bisect_right(item.dates, expiry)
+            if cutoff != len(item.dates):
+                # Slicing rather than filtering also keeps a match-payday
+                # trim from mutating the shared income date list.
+                item.dates = item.dates[:cutoff]
+
     def recalculate_schedules(self, end_date, holidays):
         """Recalculates all recurring dates based on the new budget period."""
         print("\nRecalculating all schedules for the new budget period...")
@@ -529,27 +681,19 @@ class Budget:
                 self.income.dates = []
 
             if self.income.expiry_date:
-                self.income.dates = [d for d in self.income.dates if d <= self.income.expiry_date]
-
-        # Recalculate Expenses & Savings
-        items_to_recalculate = self.expenses + self.savings_transfers
-        for item in items_to_recalculate:
-            freq = item.frequency
-            should_adjust = (isinstance(item, SavingsTransfer) and item.frequency == 'match payday')
-
-            if freq == 'match payday' and self.income:
-                item.dates = self.income.dates
-            elif item.start_date_for_schedule:
-                original_start = item.start_date_for_schedule
-                if freq == 'bi-monthly':
-                    item.dates = calculate_bi_monthly_dates_every_two_months(original_start, end_date, holidays,
-                                                                             adjust_for_holidays=should_adjust)
-                elif freq not in ['one-time', 'manual']:
-                    item.dates = get_recurring_dates(original_start, end_date, freq, holidays,
-                                                     adjust_for_holidays=should_adjust)
-
-            if hasattr(item, 'expiry_date') and item.expiry_date:
-                item.dates = [d for d in item.dates if d <= item.expiry_date]
+                # Dates are ascending, so the cutoff is a bisect; skip the
+                # slice (and its copy) when nothing lies past the expiry.
+                cutoff = bisect_right(self.income.dates, self.income.expiry_date)
+                if cutoff != len(self.income.dates):
+                    self.income.dates = self.income.dates[:cutoff]
+
+        # Recalculate Expenses & Savings. The two lists are walked separately
+        # so each pass knows its adjustment rule up front, with no per-item
+        # isinstance check and no concatenated scratch list.
+        for item in self.expenses:
+            self._recalculate_item_dates(item, False, item.expiry_date, end_date, holidays)
+        for item in self.savings_transfers:
+            self._recalculate_item_dates(item, item.frequency == 'match payday', None, end_date, holidays)
 
         # --- Pro-rated Paycheck Logic Part 2: Calculate and add the new check ---
         if self.income and self.income.expiry_date and self.income.dates:
@@ -565,11 +709,11 @@ class Budget:
                 elif freq == 'bi-weekly':
                     period_days = 14
                 elif freq == 'monthly':
-                    days_in_month = calendar.monthrange(last_payday.year, last_payday.month)[1]
+                    days_in_month = _days_in_month(last_payday.year, last_payday.month)
                     period_days = days_in_month
                 elif freq == 'twice-monthly':
                     # --- THIS IS THE CORRECTED LINE ---
-                    days_in_month = calendar.monthrange(last_payday.year, last_payday.month)[1]
+                    days_in_month = _days_in_month(last_payday.year, last_payday.month)
                     period_days = days_in_month / 2.0
                 elif freq == 'quarterly':
                     period_days = 365.25 / 4
@@ -593,6 +737,13 @@ class Budget:
         print("Schedules recalculated.")
 
 
+def _json_date_default(o):
+    """json.dump default hook that writes date objects as ISO strings."""
+    if isinstance(o, date):
+        return o.isoformat()
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
 class User:
     """Manages user data, including loading and saving their budget."""
 
@@ -600,15 +751,29 @@ class User:
         self.username = username
         self.directory = username
         self.budget_filepath = os.path.join(self.directory, "my_budget_data.json")
+        self.budget_cache_filepath = self.budget_filepath + ".pkl"
         self.budget = None
 
     def load_budget(self):
-        """Loads the budget from the user's JSON file."""
+        """Loads the budget from the user's JSON file (or its pickle cache)."""
         if not os.path.exists(self.budget_filepath):
             print(f"No existing budget file found for {self.username}. Starting a new budget setup.")
             self.budget = Budget()
             return
 
+        # Fast path: a pickle sidecar written at save time restores the
+        # object graph directly, skipping JSON parsing and the per-date
+        # fromisoformat calls in from_dict. The JSON file stays canonical:
+        # the cache is only trusted while it is at least as new.
+        try:
+            if os.path.getmtime(self.budget_cache_filepath) >= os.path.getmtime(self.budget_filepath):
+                with open(self.budget_cache_filepath, 'rb') as f:
+                    self.budget = pickle.load(f)
+                print(f"Budget configuration loaded for {self.username}.")
+                return
+        except (OSError, pickle.UnpicklingError, AttributeError, EOFError):
+            pass  # stale, missing, or unreadable cache: fall back to JSON
+
         with open(self.budget_filepath, 'r') as f:
             try:
                 data = json.load(f)
@@ -622,7 +787,14 @@ class User:
         """Saves the user's budget to their JSON file."""
         if self.budget:
             with open(self.budget_filepath, 'w') as f:
-                json.dump(self.budget.to_dict(), f, indent=4)
+                json.dump(self.budget.to_dict(), f, indent=4, default=_json_date_default)
+            # Written after the JSON so a crash between the two writes leaves
+            # the cache older than the JSON and therefore ignored on load.
+            try:
+                with open(self.budget_cache_filepath, 'wb') as f:
+                    pickle.dump(self.budget, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError:
+                pass  # the cache is best-effort; the JSON save succeeded
             print(f"\nBudget configuration saved for {self.username}.")
 
     def setup_directories(self):
@@ -637,6 +809,18 @@ class BudgetPlannerApp:
     def __init__(self):
         self.current_user = None
         self.holidays = set()
+        self._known_users = None
+
+    def _list_users(self):
+        """
+        Returns the set of account folder names. One os.scandir pass (whose
+        entries carry their file type) replaces a stat call per directory
+        entry, and the result is kept for later membership checks.
+        """
+        if self._known_users is None:
+            self._known_users = {entry.name for entry in os.scandir()
+                                 if entry.is_dir() and not entry.name.startswith('.')}
+        return self._known_users
 
     def run(self):
         """Starts the main application loop."""
@@ -665,16 +849,16 @@ class BudgetPlannerApp:
                 break
 
     def _handle_sign_in(self):
-        users = [d for d in os.listdir() if os.path.isdir(d) and not d.startswith('.')]
+        users = self._list_users()
         if not users:
             print("No user accounts found. Please sign up first.")
             return
-        print("Existing Users:", ", ".join(users))
+        print("Existing Users:", ", ".join(sorted(users)))
         username = input("Enter your username: ").lower()
         if not username.strip():
             print("Username cannot be empty.")
             return
-        if os.path.isdir(username):
+        if username in users:
             print(f"Welcome back, {username}!")
             self.current_user = User(username)
             self.current_user.load_budget()
@@ -687,13 +871,14 @@ class BudgetPlannerApp:
         if not username.strip():
             print("Username cannot be empty.")
             return
-        if os.path.isdir(username):
+        if username in self._list_users():
             print(f"Error: Username '{username}' already exists. Please sign in.")
             return
 
         try:
             self.current_user = User(username)
             self.current_user.setup_directories()
+            self._list_users().add(username)
             print(f"Account '{username}' created successfully!")
             self.current_user.load_budget()
             self._run_user_session()
@@ -701,17 +886,18 @@ class BudgetPlannerApp:
             print(f"Error creating directory for user '{username}': {e}")
 
     def _handle_delete_account(self):
-        users = [d for d in os.listdir() if os.path.isdir(d) and not d.startswith('.')]
+        users = self._list_users()
         if not users:
             print("No user accounts found to delete.")
             return
-        print("Existing Users:", ", ".join(users))
+        print("Existing Users:", ", ".join(sorted(users)))
         username = input("Enter the username of the account to delete: ").lower()
         if username in users:
             if get_yes_no_input(
                     f"Are you sure you want to permanently delete the account for '{username}'? This cannot be undone."):
                 try:
                     shutil.rmtree(username)
+                    users.discard(username)
                     print(f"Account '{username}' has been deleted.")
                 except OSError as e:
                     print(f"Error deleting account: {e}")
@@ -723,13 +909,17 @@ class BudgetPlannerApp:
         if not self.current_user or not self.current_user.budget:
             return
 
-        start_date, end_date, _ = self._manage_budget_period()
+        start_date, end_date, period_changed = self._manage_budget_period()
         self._setup_holidays_and_recalculate(start_date, end_date)
+        # Coarse dirty flag: set whenever a menu that can mutate the budget is
+        # entered, cleared on save. Skips the JSON serialize + write (and the
+        # exit prompt) when the session only viewed data.
+        budget_dirty = period_changed
 
         while True:
             print("\n--- Main Menu ---")
             print(f"User: {self.current_user.username}")
-            print(f"Budget Period: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+            print(f"Budget Period: {start_date.isoformat()} to {end_date.isoformat()}")
             print("1. Guided Budget Setup")
             print("2. Manage Specific Categories")
             print("3. Generate Budget Report and Save")
@@ -739,16 +929,20 @@ class BudgetPlannerApp:
 
             if choice == '1':
                 self._run_guided_setup(end_date)
+                budget_dirty = True
             elif choice == '2':
                 new_start, new_end, period_changed = self._manage_categories_menu(start_date, end_date)
+                budget_dirty = True
                 if period_changed:
                     start_date, end_date = new_start, new_end
                     self._setup_holidays_and_recalculate(start_date, end_date)
             elif choice == '3':
                 self._generate_report(start_date, end_date)
-                self.current_user.save_budget()
+                if budget_dirty:
+                    self.current_user.save_budget()
+                    budget_dirty = False
             elif choice == '4':
-                if get_yes_no_input("Do you want to save any changes before exiting?"):
+                if budget_dirty and get_yes_no_input("Do you want to save any changes before exiting?"):
                     self.current_user.save_budget()
                 print(f"Exiting session for {self.current_user.username}.")
                 break
@@ -765,7 +959,7 @@ class BudgetPlannerApp:
 
         if start_date and end_date:
             print(
-                f"Current budget period is from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}.")
+                f"Current budget period is from {start_date.isoformat()} to {end_date.isoformat()}.")
             if not get_yes_no_input("Do you want to change it?"):
                 return start_date, end_date, period_changed
 
@@ -783,8 +977,18 @@ class BudgetPlannerApp:
             else:
                 print("Error: The end date must be after the start date. Please try again.")
 
-    def _setup_holidays_and_recalculate(self, start_date, end_date):
-        """Handles holiday file setup and recalculates all schedules."""
+    def _setup_holidays_and_recalculate(self, start_date, end_date, holidays=None):
+        """Handles holiday file setup and recalculates all schedules.
+
+        A pre-parsed holiday set may be passed in via `holidays` to skip the
+        file lookup entirely (callers that already hold one avoid re-reading
+        the holiday files for every recalculation).
+        """
+        if holidays is not None:
+            self.holidays = frozenset(holidays)
+            self.current_user.budget.recalculate_schedules(end_date, self.holidays)
+            return
+
         print("\n--- Holiday Information ---")
         required_years = range(start_date.year, end_date.year + 1)
         holiday_files_to_load = []
@@ -868,7 +1072,16 @@ class BudgetPlannerApp:
 
         output_filename = os.path.join(self.current_user.directory, "budget_plan.csv")
 
-        report_budget = copy.deepcopy(self.current_user.budget)
+        # Shallow clone instead of deepcopy: recalculate_schedules only ever
+        # rebinds item .dates lists (and appends/removes pro-rated entries),
+        # so copying the budget and its items one level deep is enough to
+        # leave the session's budget untouched. The date lists themselves are
+        # shared but replaced, never mutated in place.
+        source_budget = self.current_user.budget
+        report_budget = copy.copy(source_budget)
+        report_budget.expenses = [copy.copy(exp) for exp in source_budget.expenses]
+        report_budget.savings_transfers = [copy.copy(t) for t in source_budget.savings_transfers]
+        report_budget.income = copy.copy(source_budget.income) if source_budget.income else None
         report_budget.recalculate_schedules(end_date, self.holidays)
 
         all_expenses_to_process = report_budget.expenses
@@ -877,112 +1090,129 @@ class BudgetPlannerApp:
         all_income_paydates = report_budget.income.dates if report_budget.income else []
 
         start_of_first_week = start_date - timedelta(days=start_date.weekday())
-        weeks = []
-        current_week_start = start_of_first_week
-        while current_week_start <= end_date:
-            weeks.append(current_week_start)
-            current_week_start += timedelta(weeks=1)
+        total_weeks = (end_date - start_of_first_week).days // 7 + 1
+        weeks = [start_of_first_week + timedelta(weeks=i) for i in range(max(total_weeks, 0))]
+
+        if not weeks:
+            print("\nNo financial data to generate report.")
+            return
 
-        financial_data = []
-        cumulative_savings_by_target = defaultdict(float)
-        for acc in report_budget.savings_accounts:
-            cumulative_savings_by_target[acc.name] = acc.balance
+        # Determine the full column set up front so rows can be streamed to
+        # disk as they are computed instead of being held in memory until the
+        # end. An item contributes a column if any of its dates lands in a
+        # report week that is not past the item's expiry date.
+        period_start = weeks[0]
+        period_end = weeks[-1] + timedelta(days=6)
+
+        period_start_ord = period_start.toordinal()
+        period_end_ord = period_end.toordinal()
+
+        expense_key_set = set()
+        for item in all_expenses_to_process:
+            expiry_ord = item.expiry_date.toordinal() if item.expiry_date else None
+            for item_date in item.dates:
+                item_ord = item_date.toordinal()
+                # Ordinal 1 is a Monday, so (ord - 1) % 7 is the weekday and
+                # subtracting it lands on the Monday of the date's week.
+                if period_start_ord <= item_ord <= period_end_ord and (
+                        expiry_ord is None
+                        or item_ord - (item_ord - 1) % 7 <= expiry_ord):
+                    expense_key_set.add(f"{item.category}: {item.name}")
+                    break
 
-        running_balance = report_budget.initial_debit_balance
+        applied_targets = set()
+        for s_transfer in all_savings_to_process:
+            if any(period_start <= d <= period_end for d in s_transfer.dates):
+                applied_targets.add(s_transfer.target)
 
-        for week_start in weeks:
-            week_end = week_start + timedelta(days=6)
-            week_of_year = week_start.isocalendar()[1]
-
-            weekly_income = 0.0
-            weekly_expenses_breakdown = defaultdict(float)
-            weekly_total_expenses = 0.0
-            weekly_total_savings = 0.0
-            weekly_savings_by_target = defaultdict(float)
-
-            if report_budget.income:
-                for pay_date in all_income_paydates:
-                    if week_start <= pay_date <= week_end:
-                        weekly_income += report_budget.income.amount
-
-            for item in all_misc_income_to_process:
-                for income_date in item.dates:
-                    if week_start <= income_date <= week_end:
-                        # The amount in budget.json is positive, so just add it.
-                        weekly_income += item.amount
-
-            for item in all_expenses_to_process:
-                should_apply_expense_this_week = False
-                if item.expiry_date and week_start > item.expiry_date:
-                    continue
-
-                if item.dates:
-                    for expense_date in item.dates:
-                        if week_start <= expense_date <= week_end:
-                            should_apply_expense_this_week = True
-                            break
+        cumulative_targets = {acc.name for acc in report_budget.savings_accounts} | applied_targets
+        savings_keys = sorted(
+            {f'Savings Transferred ({t})' for t in applied_targets}
+            | {f'Saved Amount at End of Week ({t})' for t in cumulative_targets})
+        expense_keys = sorted(expense_key_set)
 
-                if should_apply_expense_this_week:
-                    key_name = f"{item.category}: {item.name}"
-                    weekly_expenses_breakdown[key_name] += item.amount
-                    weekly_total_expenses += item.amount
-
-            for s_transfer in all_savings_to_process:
-                should_apply_savings_this_week = False
-                if s_transfer.dates:
-                    for s_date in s_transfer.dates:
-                        if week_start <= s_date <= week_end:
-                            should_apply_savings_this_week = True
-                            break
-                if should_apply_savings_this_week:
-                    weekly_savings_by_target[s_transfer.target] += s_transfer.amount
-                    weekly_total_savings += s_transfer.amount
-
-            running_balance += weekly_income - weekly_total_expenses - weekly_total_savings
-            for target, amount in weekly_savings_by_target.items():
-                cumulative_savings_by_target[target] += amount
-
-            week_data_row = {
-                'Week of Year': week_of_year,
-                'Week Start Date': week_start.strftime("%Y-%m-%d"),
-                'Week End Date': week_end.strftime("%Y-%m-%d"),
-                'Income Received': weekly_income,
-                'Total Weekly Expenses': weekly_total_expenses,
-                'Total Savings Transferred': weekly_total_savings,
-                'Running Balance at End of Week': running_balance,
-                **weekly_expenses_breakdown
-            }
-            for target, amount in weekly_savings_by_target.items():
-                week_data_row[f'Savings Transferred ({target})'] = amount
-            for target, cumulative_amount in cumulative_savings_by_target.items():
-                week_data_row[f'Saved Amount at End of Week ({target})'] = cumulative_amount
-            financial_data.append(week_data_row)
-
-        if financial_data:
-            all_keys = set()
-            for row in financial_data:
-                all_keys.update(row.keys())
-
-            ordered_keys_initial = [
-                'Week of Year', 'Week Start Date', 'Week End Date', 'Income Received',
-                'Total Weekly Expenses', 'Total Savings Transferred', 'Running Balance at End of Week'
-            ]
-            savings_keys = sorted([k for k in all_keys if 'Saved Amount' in k or 'Savings Transferred' in k])
-            expense_keys = sorted([k for k in all_keys if k not in ordered_keys_initial and k not in savings_keys])
-            final_keys = ordered_keys_initial + savings_keys + expense_keys
-
-            standardized_financial_data = []
-            for row in financial_data:
-                standardized_row = {key: row.get(key, '') for key in final_keys}
-                standardized_financial_data.append(standardized_row)
-
-            with open(output_filename, 'w', newline='') as output_file:
-                dict_writer = csv.DictWriter(output_file, fieldnames=final_keys)
-                dict_writer.writeheader()
-                dict_writer.writerows(standardized_financial_data)
-            print(f"\nBudget plan report generated as '{output_filename}'.")
-        else:
-            print("\nNo financial data to generate report.")
+        ordered_keys_initial = [
+            'Week of Year', 'Week Start Date', 'Week End Date', 'Income Received',
+            'Total Weekly Expenses', 'Total Savings Transferred', 'Running Balance at End of Week'
+        ]
+        final_keys = ordered_keys_initial + savings_keys + expense_keys
+
+        # Plain dict: the keys are known (accounts up front, transfer targets
+        # on first use), so nothing needs __missing__ dispatch per update.
+        cumulative_savings_by_target = {acc.name: acc.balance for acc in report_budget.savings_accounts}
+
+        running_balance = report_budget.initial_debit_balance
+
+        # Compute every row's week number and date labels in one pass up
+        # front; isoformat is the C fast path for the fixed YYYY-MM-DD text.
+        week_labels = [(w.isocalendar()[1], w.isoformat(), (w + timedelta(days=6)).isoformat())
+                       for w in weeks]
+
+        # Bin every cashflow event into its week up front, so the weekly loop
+        # below does no per-item work at all: it just reads its bucket. Total
+        # cost is proportional to the number of occurrences, not items x weeks.
+        num_weeks = len(weeks)
+        income_by_week = [0.0] * num_weeks
+        if report_budget.income:
+            income_amount = report_budget.income.amount
+            for pay_date in all_income_paydates:
+                week_index = (pay_date.toordinal() - period_start_ord) // 7
+                if 0 <= week_index < num_weeks:
+                    income_by_week[week_index] += income_amount
+        for item in all_misc_income_to_process:
+            for income_date in item.dates:
+                week_index = (income_date.toordinal() - period_start_ord) // 7
+                if 0 <= week_index < num_weeks:
+                    # The amount in budget.json is positive, so just add it.
+                    income_by_week[week_index] += item.amount
+
+        expense_totals, expense_breakdowns = bin_weekly_amounts(
+            all_expenses_to_process, weeks,
+            lambda item: f"{item.category}: {item.name}")
+        savings_totals, savings_breakdowns = bin_weekly_amounts(
+            all_savings_to_process, weeks,
+            lambda s_transfer: s_transfer.target)
+
+        # A plain csv.writer with a precomputed column index avoids the
+        # per-row key hashing DictWriter does against its fieldnames. The
+        # savings column names are resolved to indices here too, so the row
+        # loop never rebuilds their f-string labels.
+        key_index = {key: i for i, key in enumerate(final_keys)}
+        transfer_col = {t: key_index[f'Savings Transferred ({t})'] for t in applied_targets}
+        cumulative_col = {t: key_index[f'Saved Amount at End of Week ({t})'] for t in cumulative_targets}
+        num_keys = len(final_keys)
+        # Large write buffer: the whole report usually fits, so the file
+        # goes out in one or two syscalls when it is closed.
+        with open(output_filename, 'w', newline='', buffering=1 << 20) as output_file:
+            csv_writer = csv.writer(output_file)
+            csv_writer.writerow(final_keys)
+
+            for week_index, (week_of_year, week_start_label, week_end_label) in enumerate(week_labels):
+                weekly_income = income_by_week[week_index]
+                weekly_total_expenses = expense_totals[week_index]
+                weekly_expenses_breakdown = expense_breakdowns[week_index]
+                weekly_total_savings = savings_totals[week_index]
+                weekly_savings_by_target = savings_breakdowns[week_index]
+
+                running_balance += weekly_income - weekly_total_expenses - weekly_total_savings
+
+                row = [''] * num_keys
+                row[0] = week_of_year
+                row[1] = week_start_label
+                row[2] = week_end_label
+                row[3] = weekly_income
+                row[4] = weekly_total_expenses
+                row[5] = weekly_total_savings
+                row[6] = running_balance
+                for key, amount in weekly_expenses_breakdown.items():
+                    row[key_index[key]] = amount
+                for target, amount in weekly_savings_by_target.items():
+                    cumulative_savings_by_target[target] = cumulative_savings_by_target.get(target, 0.0) + amount
+                    row[transfer_col[target]] = amount
+                for target, cumulative_amount in cumulative_savings_by_target.items():
+                    row[cumulative_col[target]] = cumulative_amount
+                csv_writer.writerow(row)
+        print(f"\nBudget plan report generated as '{output_filename}'.")
 
     def _run_guided_setup(self, end_date):
         """Runs the user through all management functions sequentially."""
@@ -1031,9 +1261,10 @@ class BudgetPlannerApp:
                 else:
                     break
             else:
-                print("Current Savings Accounts:")
-                for i, acc in enumerate(savings_accounts):
-                    print(f"  {i + 1}. {acc.name}: ${acc.balance:.2f}")
+                lines = ["Current Savings Accounts:"]
+                lines.extend(f"  {i + 1}. {acc.name}: ${acc.balance:.2f}"
+                             for i, acc in enumerate(savings_accounts))
+                print('\n'.join(lines))
 
                 if get_yes_no_input("\nDo you want to add a new saving account or modify your existing ones?"):
                     try:
@@ -1056,10 +1287,10 @@ class BudgetPlannerApp:
                             old_name = savings_accounts[idx].name
                             if get_yes_no_input(
                                     f"Do you want to remove the '{old_name}' account? (This will also remove associated transfer schedules)"):
-                                # Cascade delete
-                                self.current_user.budget.savings_transfers = [t for t in
-                                                                              self.current_user.budget.savings_transfers
-                                                                              if t.target != old_name]
+                                # Cascade delete in place so other references
+                                # to the transfers list stay valid
+                                transfers = self.current_user.budget.savings_transfers
+                                transfers[:] = [t for t in transfers if t.target != old_name]
                                 savings_accounts.pop(idx)
                                 print(f"Account '{old_name}' and its transfers have been removed.")
                             else:
@@ -1090,28 +1321,37 @@ class BudgetPlannerApp:
             new_amount = get_float_input(f"Enter new income (or press Enter to keep ${income_item.amount:.2f})")
             if new_amount is not None: income_item.amount = new_amount
 
+            # Track whether any schedule-affecting field actually changed;
+            # amount-only edits skip the recalculation entirely.
+            schedule_changed = False
             if get_yes_no_input("Do you want to update the frequency or schedule start date?"):
                 new_freq = get_frequency_input(
                     f"Enter new frequency (or press Enter to keep '{income_item.frequency}')",
                     extra_options=['twice-monthly'])
-                if new_freq is not None: income_item.frequency = new_freq
+                if new_freq is not None:
+                    income_item.frequency = new_freq
+                    schedule_changed = True
 
                 # Use the existing start date as a default for the prompt
                 prompt = "Enter the date of your next upcoming paycheck"
                 if income_item.start_date_for_schedule:
-                    prompt += f" (or press Enter to keep {income_item.start_date_for_schedule.strftime('%Y-%m-%d')})"
+                    prompt += f" (or press Enter to keep {income_item.start_date_for_schedule.isoformat()})"
 
                 new_start_date = get_date_input(prompt)
-                if new_start_date is not None: income_item.start_date_for_schedule = new_start_date
+                if new_start_date is not None:
+                    income_item.start_date_for_schedule = new_start_date
+                    schedule_changed = True
 
             if get_yes_no_input("Do you want to update the income end date?"):
                 if get_yes_no_input("Does this income have an end date?"):
                     income_item.expiry_date = get_date_input("Enter the income end date")
                 else:
                     income_item.expiry_date = None
+                schedule_changed = True
 
             # After all changes, perform a full recalculation of the income schedule
-            self._update_single_item_schedule(income_item, end_date)
+            if schedule_changed:
+                self._update_single_item_schedule(income_item, end_date)
 
         # --- ADD NEW INCOME ---
         else:
@@ -1140,8 +1380,7 @@ class BudgetPlannerApp:
             print("Warning: No pay dates were generated for the budget period.")
         else:
             print("\nCalculated Pay Dates for your budget period:")
-            for date in budget.income.dates[:12]:
-                print(f"- {date.strftime('%Y-%m-%d')}")
+            print('\n'.join(f"- {pay_date.isoformat()}" for pay_date in budget.income.dates[:12]))
             if len(budget.income.dates) > 12:
                 print(f"... and {len(budget.income.dates) - 12} more.")
 
@@ -1191,66 +1430,80 @@ class BudgetPlannerApp:
 
         if current_expenses:
             if get_yes_no_input(f"Do you want to modify or remove an existing item in {category_name}?"):
+                # Removals are marked here and compacted once after the loop,
+                # so pruning many items stays O(n) overall.
+                removed_items = set()
                 while True:
-                    current_expenses_loop = [exp for exp in budget.expenses if exp.category == category_name]
+                    current_expenses_loop = [exp for exp in budget.expenses
+                                             if exp.category == category_name and exp not in removed_items]
                     if not current_expenses_loop:
                         print(f"No more items in {category_name} to modify.")
                         break
 
-                    print(f"Existing {category_name}:")
+                    # Emit the listing as one print instead of one per item.
+                    lines = [f"Existing {category_name}:"]
                     for i, item in enumerate(current_expenses_loop):
-                        expiry_info = f", Expires: {item.expiry_date.strftime('%Y-%m-%d')}" if item.expiry_date else ", No expiry"
-                        print(f"  {i + 1}. {item.name}: ${item.amount:.2f} ({item.frequency}{expiry_info})")
+                        expiry_info = f", Expires: {item.expiry_date.isoformat()}" if item.expiry_date else ", No expiry"
+                        lines.append(f"  {i + 1}. {item.name}: ${item.amount:.2f} ({item.frequency}{expiry_info})")
+                    print('\n'.join(lines))
+
+                    choice = input(
+                        "Enter the number of the item to modify/remove, or 'done' to finish: ").lower()
+                    if choice == 'done': break
+                    if not choice.isdigit():
+                        print("Invalid input. Please enter a number or 'done'.")
+                        continue
+                    idx = int(choice) - 1
+
+                    if 0 <= idx < len(current_expenses_loop):
+                        selected_item = current_expenses_loop[idx]
+                        if get_yes_no_input("Do you want to remove this item?"):
+                            removed_items.add(selected_item)
+                            print(f"'{selected_item.name}' removed.")
+                            continue
 
-                    try:
-                        choice = input(
-                            f"Enter the number of the item to modify/remove, or 'done' to finish: ").lower()
-                        if choice == 'done': break
-                        idx = int(choice) - 1
-
-                        if 0 <= idx < len(current_expenses_loop):
-                            selected_item = current_expenses_loop[idx]
-                            if get_yes_no_input(f"Do you want to remove this item?"):
-                                budget.expenses.remove(selected_item)
-                                print(f"'{selected_item.name}' removed.")
-                                continue
+                        # --- MODIFIED LOGIC ---
+                        # First, update all properties of the item
+                        new_name = input(f"Enter new name (or press Enter to keep '{selected_item.name}'): ")
+                        if new_name: selected_item.name = new_name
+
+                        new_amount = get_float_input(
+                            f"Enter new amount (or press Enter to keep ${selected_item.amount:.2f})")
+                        if new_amount is not None: selected_item.amount = new_amount
+
+                        # Name/amount-only edits don't touch the schedule, so
+                        # only recalculate when the schedule or expiry changed.
+                        schedule_changed = False
+                        if get_yes_no_input("Do you want to update the payment schedule?"):
+                            # For expenses, we don't adjust for holidays
+                            freq, dates, start_sched = self._get_schedule(end_date,
+                                                                          adjust_for_holidays=False)
+                            if freq:
+                                selected_item.frequency = freq
+                                # Temporarily assign dates; they will be recalculated and filtered next
+                                selected_item.dates = dates
+                                selected_item.start_date_for_schedule = start_sched
+                                schedule_changed = True
+
+                        if get_yes_no_input("Do you want to update the expiry date?"):
+                            if get_yes_no_input("Does it have an expiry date?"):
+                                selected_item.expiry_date = get_date_input("Enter the new expiry date")
+                            else:
+                                selected_item.expiry_date = None
+                            schedule_changed = True
 
-                            # --- MODIFIED LOGIC ---
-                            # First, update all properties of the item
-                            new_name = input(f"Enter new name (or press Enter to keep '{selected_item.name}'): ")
-                            if new_name: selected_item.name = new_name
-
-                            new_amount = get_float_input(
-                                f"Enter new amount (or press Enter to keep ${selected_item.amount:.2f})")
-                            if new_amount is not None: selected_item.amount = new_amount
-
-                            if get_yes_no_input("Do you want to update the payment schedule?"):
-                                # For expenses, we don't adjust for holidays
-                                freq, dates, start_sched = self._get_schedule(end_date,
-                                                                              adjust_for_holidays=False)
-                                if freq:
-                                    selected_item.frequency = freq
-                                    # Temporarily assign dates; they will be recalculated and filtered next
-                                    selected_item.dates = dates
-                                    selected_item.start_date_for_schedule = start_sched
-
-                            if get_yes_no_input("Do you want to update the expiry date?"):
-                                if get_yes_no_input("Does it have an expiry date?"):
-                                    selected_item.expiry_date = get_date_input("Enter the new expiry date")
-                                else:
-                                    selected_item.expiry_date = None
-
-                            # Second, recalculate the schedule based on all updated properties
+                        # Second, recalculate the schedule based on all updated properties
+                        if schedule_changed:
                             self._update_single_item_schedule(selected_item, end_date)
-                            print(f"'{selected_item.name}' updated.")
-                        else:
-                            print("Invalid number.")
-                    except ValueError:
-                        print("Invalid input. Please enter a number or 'done'.")
+                        print(f"'{selected_item.name}' updated.")
+                    else:
+                        print("Invalid number.")
+                if removed_items:
+                    budget.expenses = [exp for exp in budget.expenses if exp not in removed_items]
 
         if get_yes_no_input(f"Do you want to add a new item to {category_name}?"):
             while True:
-                name = input(f"Enter the name of the new item: ")
+                name = input("Enter the name of the new item: ")
                 amount = get_float_input(f"Enter the amount for {name}")
                 if amount is None: break
 
@@ -1291,45 +1544,51 @@ class BudgetPlannerApp:
         # Only ask to modify if one-time expenses exist.
         if one_time_expenses:
             if get_yes_no_input("Do you want to modify or remove an existing one-time expense?"):
+                # Same tombstone-and-compact pattern as the category editor.
+                removed_items = set()
                 while True:
                     # Re-fetch inside loop
-                    one_time_expenses_loop = [exp for exp in budget.expenses if exp.category == 'One-Time']
+                    one_time_expenses_loop = [exp for exp in budget.expenses
+                                              if exp.category == 'One-Time' and exp not in removed_items]
                     if not one_time_expenses_loop:
                         print("No more one-time expenses to modify.")
                         break
 
-                    print("Existing One-Time Expenses:")
+                    lines = ["Existing One-Time Expenses:"]
                     for i, item in enumerate(one_time_expenses_loop):
-                        date_str = item.dates[0].strftime('%Y-%m-%d') if item.dates else "N/A"
-                        print(f"  {i + 1}. {item.name}: ${item.amount:.2f} on {date_str}")
-
-                    try:
-                        choice = input(
-                            "Enter the number of the expense to modify/remove, or 'done' to finish: ").lower()
-                        if choice == 'done': break
-                        idx = int(choice) - 1
-                        if 0 <= idx < len(one_time_expenses_loop):
-                            selected_item = one_time_expenses_loop[idx]
-                            if get_yes_no_input(f"Do you want to remove this expense?"):
-                                budget.expenses.remove(selected_item)
-                                print(f"'{selected_item.name}' removed.")
-                                continue
+                        date_str = item.dates[0].isoformat() if item.dates else "N/A"
+                        lines.append(f"  {i + 1}. {item.name}: ${item.amount:.2f} on {date_str}")
+                    print('\n'.join(lines))
+
+                    choice = input(
+                        "Enter the number of the expense to modify/remove, or 'done' to finish: ").lower()
+                    if choice == 'done': break
+                    if not choice.isdigit():
+                        print("Invalid input.")
+                        continue
+                    idx = int(choice) - 1
+                    if 0 <= idx < len(one_time_expenses_loop):
+                        selected_item = one_time_expenses_loop[idx]
+                        if get_yes_no_input("Do you want to remove this expense?"):
+                            removed_items.add(selected_item)
+                            print(f"'{selected_item.name}' removed.")
+                            continue
 
-                            new_name = input(f"Enter new name (or press Enter to keep '{selected_item.name}'): ")
-                            if new_name: selected_item.name = new_name
+                        new_name = input(f"Enter new name (or press Enter to keep '{selected_item.name}'): ")
+                        if new_name: selected_item.name = new_name
 
-                            new_amount = get_float_input(
-                                f"Enter new amount (or press Enter to keep ${selected_item.amount:.2f})")
-                            if new_amount is not None: selected_item.amount = new_amount
+                        new_amount = get_float_input(
+                            f"Enter new amount (or press Enter to keep ${selected_item.amount:.2f})")
+                        if new_amount is not None: selected_item.amount = new_amount
 
-                            if get_yes_no_input("Update the date?"):
-                                selected_item.dates = [get_date_input("Enter the new date")]
+                        if get_yes_no_input("Update the date?"):
+                            selected_item.dates = [get_date_input("Enter the new date")]
 
-                            print(f"'{selected_item.name}' updated.")
-                        else:
-                            print("Invalid number.")
-                    except ValueError:
-                        print("Invalid input.")
+                        print(f"'{selected_item.name}' updated.")
+                    else:
+                        print("Invalid number.")
+                if removed_items:
+                    budget.expenses = [exp for exp in budget.expenses if exp not in removed_items]
 
         # This 'add' part is always asked.
         if get_yes_no_input("Do you want to add a new one-time expense?"):
@@ -1351,55 +1610,63 @@ class BudgetPlannerApp:
 
         if budget.savings_transfers:
             if get_yes_no_input("Do you want to modify or remove an existing savings transfer?"):
+                removed_transfers = set()
                 while True:
-                    if not budget.savings_transfers:
+                    transfers_loop = [t for t in budget.savings_transfers if t not in removed_transfers]
+                    if not transfers_loop:
                         print("No savings transfers to modify.")
                         break
 
-                    print("Existing Savings Transfers:")
-                    for i, trans in enumerate(budget.savings_transfers):
-                        print(f"  {i + 1}. ${trans.amount:.2f} ({trans.frequency}) to '{trans.target}'")
+                    lines = ["Existing Savings Transfers:"]
+                    for i, trans in enumerate(transfers_loop):
+                        lines.append(f"  {i + 1}. ${trans.amount:.2f} ({trans.frequency}) to '{trans.target}'")
+                    print('\n'.join(lines))
 
-                    try:
-                        choice = input("Enter number to modify/remove, or 'done': ").lower()
-                        if choice == 'done': break
-                        idx = int(choice) - 1
-
-                        if 0 <= idx < len(budget.savings_transfers):
-                            selected_trans = budget.savings_transfers[idx]
-                            if get_yes_no_input("Remove this transfer?"):
-                                budget.savings_transfers.pop(idx)
-                                print("Transfer removed.")
-                                continue
+                    choice = input("Enter number to modify/remove, or 'done': ").lower()
+                    if choice == 'done': break
+                    if not choice.isdigit():
+                        print("Invalid input.")
+                        continue
+                    idx = int(choice) - 1
+
+                    if 0 <= idx < len(transfers_loop):
+                        selected_trans = transfers_loop[idx]
+                        if get_yes_no_input("Remove this transfer?"):
+                            removed_transfers.add(selected_trans)
+                            print("Transfer removed.")
+                            continue
+
+                        new_amount = get_float_input(f"New amount (keep ${selected_trans.amount:.2f})")
+                        if new_amount is not None: selected_trans.amount = new_amount
+
+                        if get_yes_no_input("Change target account?"):
+                            new_target = get_savings_target_input("Choose new target", budget.savings_accounts)
+                            if new_target: selected_trans.target = new_target
 
-                            new_amount = get_float_input(f"New amount (keep ${selected_trans.amount:.2f})")
-                            if new_amount is not None: selected_trans.amount = new_amount
-
-                            if get_yes_no_input("Change target account?"):
-                                new_target = get_savings_target_input("Choose new target", budget.savings_accounts)
-                                if new_target: selected_trans.target = new_target
-
-                            if get_yes_no_input("Update schedule?"):
-                                freq_opts = ['match payday'] if budget.income else None
-                                # --- MODIFIED LOGIC ---
-                                # We set adjust_for_holidays=False because only 'match payday' should adjust,
-                                # and that case is handled automatically inside _get_schedule.
-                                freq, dates, start_sched = self._get_schedule(end_date,
-                                                                              extra_freq_options=freq_opts,
-                                                                              adjust_for_holidays=False)
-                                if freq:
-                                    selected_trans.frequency = freq
-                                    selected_trans.dates = dates
-                                    selected_trans.start_date_for_schedule = start_sched
-
-                                # After changes, we must recalculate the item's schedule
+                        if get_yes_no_input("Update schedule?"):
+                            freq_opts = ['match payday'] if budget.income else None
+                            # --- MODIFIED LOGIC ---
+                            # We set adjust_for_holidays=False because only 'match payday' should adjust,
+                            # and that case is handled automatically inside _get_schedule.
+                            freq, dates, start_sched = self._get_schedule(end_date,
+                                                                          extra_freq_options=freq_opts,
+                                                                          adjust_for_holidays=False)
+                            if freq:
+                                selected_trans.frequency = freq
+                                selected_trans.dates = dates
+                                selected_trans.start_date_for_schedule = start_sched
+
+                                # Recalculate only when a new schedule was
+                                # actually chosen; a cancelled prompt keeps
+                                # the existing dates.
                                 self._update_single_item_schedule(selected_trans, end_date)
 
-                            print("Transfer updated.")
-                        else:
-                            print("Invalid number.")
-                    except ValueError:
-                        print("Invalid input.")
+                        print("Transfer updated.")
+                    else:
+                        print("Invalid number.")
+                if removed_transfers:
+                    budget.savings_transfers = [t for t in budget.savings_transfers
+                                                if t not in removed_transfers]
 
         if get_yes_no_input("Add a new savings transfer?"):
             if not budget.savings_accounts:
@@ -1441,7 +1708,7 @@ class BudgetPlannerApp:
         dates = []
         start_date_for_schedule = None
 
-        if get_yes_no_input("Do you want to set a periodic schedule? (e.g., weekly, monthly)"):
+        if get_yes_no_input(_SET_PERIODIC_PROMPT):
             frequency = get_frequency_input("How often does this occur?", extra_options=extra_freq_options)
             if not frequency: return None, [], None
 
@@ -1464,8 +1731,11 @@ class BudgetPlannerApp:
                 dates = get_recurring_dates(start_date_for_schedule, end_date, frequency, self.holidays,
                                             adjust_for_holidays=adjust_for_holidays)
         else:
-            print("You've chosen to enter specific dates manually.")
+            print(_MANUAL_DATES_HINT)
             dates = get_multiple_dates("Enter a specific date (or 'done' to finish)")
+            # Dedupe (order-preserving) and sort once here so downstream
+            # consumers can assume clean, ascending schedules.
+            dates = sorted(dict.fromkeys(dates))
             if dates:
                 frequency = "manual"
             else:
@@ -1513,9 +1783,13 @@ class BudgetPlannerApp:
                         item.start_date_for_schedule, end_date, freq, holidays, adjust_for_holidays=should_adjust
                     )
 
-        # Filter the final, regenerated list by the item's expiry date
+        # Filter the final, regenerated list by the item's expiry date.
+        # The generators emit sorted dates, so a bisect slice replaces the
+        # linear scan and only reallocates when something is actually trimmed.
         if hasattr(item, 'expiry_date') and item.expiry_date:
-            item.dates = [d for d in item.dates if d <= item.expiry_date]
+            cut = bisect_right(item.dates, item.expiry_date)
+            if cut != len(item.dates):
+                item.dates = item.dates[:cut]
 
 
 if __name__ == "__main__":
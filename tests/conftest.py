@@ -37,18 +37,30 @@ def budget_data():
         return json.load(f)
 
 
+@pytest.fixture(scope="session")
+def _holiday_template(tmp_path_factory):
+    """Copies the holiday files once per session; per-test environments link to these."""
+    template_dir = tmp_path_factory.mktemp("holiday_template")
+    for year in [2025, 2026, 2027]:
+        shutil.copy(PROJECT_ROOT / f'holidays_{year}.txt', template_dir / f'holidays_{year}.txt')
+    return template_dir
+
+
 @pytest.fixture
-def e2e_test_environment():
-    test_user_dir = PROJECT_ROOT / "test_user_temp"
-    if test_user_dir.exists():
-        shutil.rmtree(test_user_dir)
-    test_user_dir.mkdir()
+def e2e_test_environment(tmp_path_factory, _holiday_template):
+    # pytest-managed temp dirs instead of a test_user_temp folder in the
+    # project root: nothing lingers after a crashed run, and parallel
+    # workers get distinct paths. pytest prunes old basetemp dirs itself,
+    # so no explicit rmtree teardown is needed.
+    test_user_dir = tmp_path_factory.mktemp("e2e_user")
 
     holidays_dir = test_user_dir / 'holidays'
     holidays_dir.mkdir()
+    # Symlink rather than copy: the files were copied once into the session
+    # template, so each test only pays for three link creations. Tests that
+    # rewrite a holiday file must unlink it first to avoid touching the
+    # shared template.
     for year in [2025, 2026, 2027]:
-        shutil.copy(PROJECT_ROOT / f'holidays_{year}.txt', holidays_dir / f'holidays_{year}.txt')
-
-    yield test_user_dir
+        os.symlink(_holiday_template / f'holidays_{year}.txt', holidays_dir / f'holidays_{year}.txt')
 
-    shutil.rmtree(test_user_dir)
+    return test_user_dir
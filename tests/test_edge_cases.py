@@ -1,16 +1,31 @@
 import csv
 import json
 import os
-from datetime import date, datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, timedelta
 from pathlib import Path
 from typing import List, Dict, cast
 
 import pytest
 
 
-# Reuse helpers from this file if they exist; otherwise keep these local:
-def _write_budget(tmp_dir: Path, payload: dict):
-    (tmp_dir / "my_budget_data.json").write_text(json.dumps(payload, indent=2))
+@dataclass(slots=True)
+class MockUser:
+    # Module-level stand-in for main.User; defined once instead of re-running
+    # a class body inside every parametrized test call. When budget_data is
+    # set, load_budget skips the my_budget_data.json round-trip.
+    directory: Path
+    username: str = "test_user"
+    budget: object = None
+    budget_data: dict = None
+
+    def load_budget(self):
+        data = self.budget_data
+        if data is None:
+            with open(os.path.join(self.directory, "my_budget_data.json")) as f:
+                data = json.load(f)
+        from main import Budget
+        self.budget = Budget.from_dict(data)
 
 
 def _load_rows(csv_path: Path) -> List[Dict[str, str]]:
@@ -24,18 +39,19 @@ def _load_rows(csv_path: Path) -> List[Dict[str, str]]:
 
 
 def _parse_d(s: str) -> date:
-    return datetime.strptime(s, "%Y-%m-%d").date()
+    return date.fromisoformat(s)
 
 
 def _week_monday(d: date) -> date:
-    return d - timedelta(days=d.weekday())
+    # ordinal 1 (0001-01-01) is a Monday, so (n - 1) % 7 is the weekday;
+    # same arithmetic main.py uses, and it skips the timedelta allocation
+    n = d.toordinal()
+    return date.fromordinal(n - (n - 1) % 7)
 
 
 def _floatish(s) -> float:
-    try:
-        return float(s)
-    except Exception:
-        return 0.0
+    # cells are numeric or empty; no need to pay for try/except
+    return float(s) if s else 0.0
 
 
 @pytest.mark.parametrize(
@@ -68,8 +84,12 @@ def test_edge_weekend_holiday_chaining_for_last_of_month(e2e_test_environment, y
     tmp_dir = e2e_test_environment
     holidays_dir = tmp_dir / "holidays"
     holidays_dir.mkdir(exist_ok=True)
-    # Write the year-specific holidays file the app expects
-    (holidays_dir / f"holidays_{year}.txt").write_text("\n".join(holiday_strings) + "\n")
+    # Write the year-specific holidays file the app expects. Unlink first:
+    # the fixture symlinks the holiday files to a shared session template,
+    # and writing through the link would corrupt it for later tests.
+    holiday_file = holidays_dir / f"holidays_{year}.txt"
+    holiday_file.unlink(missing_ok=True)
+    holiday_file.write_text("\n".join(holiday_strings) + "\n")
 
     budget_dict = {
         "start_date": start.isoformat(),
@@ -86,22 +106,8 @@ def test_edge_weekend_holiday_chaining_for_last_of_month(e2e_test_environment, y
         "expense_categories": {},
         "savings_transfers": []
     }
-    _write_budget(tmp_dir, budget_dict)
-
-    class MockUser:
-        def __init__(self, directory):
-            self.username = "test_user"
-            self.directory = directory
-            self.budget = None
-
-        def load_budget(self):
-            with open(os.path.join(self.directory, "my_budget_data.json")) as f:
-                data = json.load(f)
-            from main import Budget
-            self.budget = Budget.from_dict(data)
-
     app = BudgetPlannerApp()
-    app.current_user = MockUser(tmp_dir)
+    app.current_user = MockUser(tmp_dir, budget_data=budget_dict)
     app.current_user.load_budget()
 
     # Recalculate with holidays, then produce the CSV
@@ -80,6 +80,33 @@ def test_pro_rated_final_paycheck(holidays):
     print("...OK")
 
 
+def test_legacy_unsorted_manual_dates_trim_correctly():
+    """
+    Regression test: budgets saved by older versions stored manual-schedule
+    dates in entry order. The bisect-based expiry trims require sorted
+    dates, so from_dict must normalize the list on load.
+    """
+    print("\nRunning: Unit Test for legacy unsorted manual date trimming...")
+    from main import Expense
+
+    expense = Expense.from_dict({
+        "name": "Legacy Manual Expense",
+        "amount": 50.0,
+        "frequency": "manual",
+        "category": "Misc Monthly",
+        "dates": ["2026-06-01", "2026-02-01", "2026-09-01"],
+        "expiry_date": "2026-03-01"
+    })
+    assert expense.dates == sorted(expense.dates), "from_dict should sort legacy date lists"
+
+    budget = Budget(start_date=date(2026, 1, 1), end_date=date(2026, 12, 31))
+    budget.expenses.append(expense)
+    budget.recalculate_schedules(budget.end_date, holidays=frozenset())
+
+    assert expense.dates == [date(2026, 2, 1)], "Expired manual dates must be trimmed, later dates dropped"
+    print("...OK")
+
+
 def test_one_time_income_dates_preserved_without_start(apply_holidays_fixture=None):
     from main import Budget, Income
     b = Budget(